@@ -0,0 +1,85 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Numba accelerated kernels for the transforms, only available when numba is installed.
+"""
+
+import numpy as np
+
+from monai.utils import optional_import
+
+
+def _bbox_gt(img, thr, margin, out_lo, out_hi):
+    """
+    Computes the bounding box of `img > thr` in a single pass over the (C, D, H, W) shaped `img`.
+    `out_lo` and `out_hi` are filled with the start and end (exclusive) of the (D, H, W) axes,
+    expanded by `margin` and clipped to the image. Returns False if there's no foreground.
+    """
+    n_c, n_d, n_h, n_w = img.shape
+    lo_d, lo_h, lo_w = n_d, n_h, n_w
+    hi_d, hi_h, hi_w = -1, -1, -1
+    for c in range(n_c):
+        for d in range(n_d):
+            for h in range(n_h):
+                for w in range(n_w):
+                    if img[c, d, h, w] > thr:
+                        lo_d, hi_d = min(lo_d, d), max(hi_d, d)
+                        lo_h, hi_h = min(lo_h, h), max(hi_h, h)
+                        lo_w, hi_w = min(lo_w, w), max(hi_w, w)
+    if hi_d < 0:
+        return False
+    out_lo[0], out_hi[0] = max(0, lo_d - margin), min(n_d, hi_d + margin + 1)
+    out_lo[1], out_hi[1] = max(0, lo_h - margin), min(n_h, hi_h + margin + 1)
+    out_lo[2], out_hi[2] = max(0, lo_w - margin), min(n_w, hi_w + margin + 1)
+    return True
+
+
+_bbox_gt_jit = None  # the compiled `_bbox_gt`, False if numba is not available
+
+
+def _get_bbox_gt():
+    """
+    Imports numba and compiles `_bbox_gt` on the first call, so that `import monai` doesn't import numba.
+    Returns False if numba is not available.
+    """
+    global _bbox_gt_jit
+    if _bbox_gt_jit is None:
+        numba, has_numba = optional_import("numba")
+        # not using `parallel=True`, as the transforms usually run in the (forked) multi-process data loader workers
+        _bbox_gt_jit = numba.njit(cache=True)(_bbox_gt) if has_numba else False
+    return _bbox_gt_jit
+
+
+def fast_bounding_box(img, threshold, margin: int = 0):
+    """
+    Computes the spatial bounding box of `img > threshold` over all the channels,
+    equivalent to ``generate_spatial_bounding_box(img, lambda x: x > threshold, None, margin)``.
+
+    Returns:
+        (box_start, box_end) lists, or None if numba is not available, the input is not supported (not an
+        integer, float32 or float64 numpy array with 1 to 3 spatial dimensions), or no foreground is found.
+        The caller is expected to fall back to :py:func:`monai.transforms.utils.generate_spatial_bounding_box`.
+    """
+    if not isinstance(img, np.ndarray) or not 2 <= img.ndim <= 4:
+        return None
+    # numba doesn't compile the kernel for other dtypes (e.g. float16)
+    if img.dtype.kind not in "iu" and img.dtype not in (np.float32, np.float64):
+        return None
+    bbox_gt = _get_bbox_gt()
+    if not bbox_gt:
+        return None
+    spatial_dims = img.ndim - 1
+    data = img.reshape(img.shape[:1] + (1,) * (3 - spatial_dims) + img.shape[1:])
+    out_lo = np.zeros(3, dtype=np.int64)
+    out_hi = np.zeros(3, dtype=np.int64)
+    if not bbox_gt(data, threshold, margin, out_lo, out_hi):
+        return None
+    return out_lo[3 - spatial_dims :].tolist(), out_hi[3 - spatial_dims :].tolist()
@@ -0,0 +1,58 @@
+# Copyright 2020 MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Numba kernels fusing chains of array transforms into a single pass, only available when numba is installed.
+"""
+
+from monai.utils import optional_import
+
+
+def _rescale_patch_rot90(img, out, y0, x0, k, mn, mx):
+    """
+    Fuses ``ScaleIntensity()``, a ``(y0, x0)`` cornered crop and ``np.rot90(patch, k)`` of the 2D `img`
+    into one read of the patch and one write of `out`. `mn` and `mx` are the min and max of the whole `img`,
+    `out` must have the shape of the rotated patch, i.e. the patch shape transposed if `k` is odd.
+    """
+    n_i, n_j = out.shape
+    # the (unrotated) patch shape
+    p_h, p_w = (n_j, n_i) if k % 2 else (n_i, n_j)
+    for i in range(n_i):
+        for j in range(n_j):
+            if k == 1:
+                src_i, src_j = j, p_w - 1 - i
+            elif k == 2:
+                src_i, src_j = p_h - 1 - i, p_w - 1 - j
+            elif k == 3:
+                src_i, src_j = p_h - 1 - j, i
+            else:
+                src_i, src_j = i, j
+            # same arithmetic as `rescale_array` to get the identical values
+            out[i, j] = 0 if mx == mn else (img[y0 + src_i, x0 + src_j] - mn) / (mx - mn)
+
+
+_rescale_patch_rot90_jit = None  # the compiled `_rescale_patch_rot90`
+
+
+def rescale_patch_rot90(img, out, y0, x0, k, mn, mx):
+    """
+    See `_rescale_patch_rot90`. numba is imported and the kernel compiled on the first call,
+    so that `import monai` doesn't import numba.
+
+    Raises:
+        RuntimeError: when numba is not available.
+    """
+    global _rescale_patch_rot90_jit
+    if _rescale_patch_rot90_jit is None:
+        numba, has_numba = optional_import("numba")
+        if not has_numba:
+            raise RuntimeError("rescale_patch_rot90 requires numba.")
+        _rescale_patch_rot90_jit = numba.njit(cache=True)(_rescale_patch_rot90)
+    _rescale_patch_rot90_jit(img, out, y0, x0, k, mn, mx)
@@ -92,6 +92,26 @@ class Randomizable(ABC):
         self.R = np.random.RandomState()
         return self
 
+    def reseed(self, seed: int):
+        """
+        Reseed the random state in place, much cheaper than ``set_random_state(seed=seed)``
+        which creates a new `np.random.RandomState`, with the same random sequence afterwards.
+        As :py:attr:`self.R` is modified in place, any other object holding this state
+        (e.g. set with ``set_random_state(state=...)``) is also reseeded, only use it if the state is not shared.
+        Falls back to ``set_random_state(seed=seed)`` if the instance doesn't have its own state yet,
+        or if the class overrides `set_random_state` (for example to seed the nested transforms).
+
+        Args:
+            seed: reseed the random state with an integer seed.
+
+        Returns:
+            a Randomizable instance.
+        """
+        if "R" not in self.__dict__ or type(self).set_random_state is not Randomizable.set_random_state:
+            return self.set_random_state(seed=seed)
+        self.R.seed(id(seed) if not isinstance(seed, int) else seed)
+        return self
+
     @abstractmethod
     def randomize(self):
         """
@@ -181,6 +201,15 @@ class Compose(Randomizable):
                 continue
             _transform.set_random_state(seed, state)
 
+    def reseed(self, seed: int):
+        """
+        Reseed the random states of the transforms in place, see :py:meth:`Randomizable.reseed`.
+        """
+        for _transform in self.transforms:
+            if not isinstance(_transform, Randomizable):
+                continue
+            _transform.reseed(seed)
+
     def randomize(self):
         for _transform in self.transforms:
             if not isinstance(_transform, Randomizable):
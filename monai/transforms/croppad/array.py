@@ -13,21 +13,90 @@ A collection of "vanilla" transforms for crop and pad operations
 https://github.com/Project-MONAI/MONAI/wiki/MONAI_Design
 """
 
-from typing import Callable, Optional
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional
 
 import numpy as np
+import torch
 from monai.config.type_definitions import IndexSelection
 from monai.data.utils import get_random_patch, get_valid_patch_size
+from monai.transforms._fast import fast_bounding_box
 from monai.transforms.compose import Randomizable, Transform
 from monai.transforms.utils import generate_spatial_bounding_box
 from monai.utils.misc import ensure_tuple, ensure_tuple_rep
 
 
+_CACHE_SIZE = 32
+
+
+def _cache_get(cache: OrderedDict, key: Hashable, build: Callable):
+    """
+    Returns `cache[key]`, calling `build()` to create and store it on a cache miss.
+    The least recently used item is evicted when the cache holds more than `_CACHE_SIZE` items.
+    """
+    value = cache.get(key)
+    if value is None:
+        value = cache[key] = build()
+        if len(cache) > _CACHE_SIZE:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(key)
+    return value
+
+
+def _select_positive(x):
+    """The default foreground selection of :py:class:`CropForeground`, select values > 0."""
+    return x > 0
+
+
+def _has_any_pad(pad_width) -> bool:
+    """Returns True if any of the `(before, after)` pairs of `pad_width` is non-zero."""
+    return any(a or b for a, b in pad_width)
+
+
+def _pad(img, pad_width, mode: str):
+    """
+    Pad `img` by `pad_width`, an equivalent of ``np.pad(img, pad_width, mode=mode)``.
+    For the 'constant' and 'edge' modes the output is preallocated and the input is copied
+    into it only once, the other modes are delegated to `np.pad`.
+    Channel first `torch.Tensor` inputs are padded with `torch.nn.functional.pad` for these modes
+    (up to 3 spatial dims, 'edge' requires a floating point tensor), and stay torch tensors.
+    """
+    if mode not in ("constant", "edge"):
+        return np.pad(img, pad_width, mode=mode)
+    # `pad_width` must cover every dim, otherwise the numpy path raises like `np.pad`
+    if isinstance(img, torch.Tensor) and len(pad_width) == img.ndim <= 4 and not any(pad_width[0]):
+        # `torch.nn.functional.pad` takes the pads from the last dim backwards
+        flat_pad = [w for pair in reversed(pad_width[1:]) for w in pair]
+        if mode == "constant":
+            return torch.nn.functional.pad(img, flat_pad, mode="constant", value=0)
+        if img.is_floating_point():
+            # 'replicate' pads the spatial dims of a batch first input
+            return torch.nn.functional.pad(img.unsqueeze(0), flat_pad, mode="replicate").squeeze(0)
+    img = np.asarray(img)
+    if mode == "edge" and any(s == 0 and (a or b) for s, (a, b) in zip(img.shape, pad_width)):
+        # nothing to replicate, let `np.pad` raise its error
+        return np.pad(img, pad_width, mode=mode)
+    out_shape = tuple(s + a + b for s, (a, b) in zip(img.shape, pad_width))
+    out = np.empty(out_shape, dtype=img.dtype)
+    out[tuple(slice(a, a + s) for s, (a, _) in zip(img.shape, pad_width))] = img
+    for axis, (s, (a, b)) in enumerate(zip(img.shape, pad_width)):
+        head = (slice(None),) * axis
+        if mode == "constant":
+            out[head + (slice(0, a),)] = 0
+            out[head + (slice(a + s, None),)] = 0
+        else:
+            out[head + (slice(0, a),)] = out[head + (slice(a, a + 1),)]
+            out[head + (slice(a + s, None),)] = out[head + (slice(a + s - 1, a + s),)]
+    return out
+
+
 class SpatialPad(Transform):
     """
     Performs padding to the data, symmetric for all sides or all on one side for each dimension.
-    Uses np.pad so in practice, a mode needs to be provided. See numpy.lib.arraypad.pad
-    for additional details.
+    The 'constant' and 'edge' modes copy the input once into a preallocated output
+    (channel first torch tensors are padded with `torch.nn.functional.pad` instead),
+    the other modes are delegated to np.pad. See numpy.lib.arraypad.pad for additional details.
 
     Args:
         spatial_size (sequence of int): the spatial size of output data after padding.
@@ -39,35 +108,37 @@ class SpatialPad(Transform):
 
     def __init__(self, spatial_size, method: str = "symmetric", mode: str = "constant"):
         self.spatial_size = ensure_tuple(spatial_size)
+        self._spatial_arr = np.asarray(self.spatial_size, dtype=np.int64)
         assert method in ("symmetric", "end"), "unsupported padding type."
         self.method = method
         assert isinstance(mode, str), "mode must be str."
         self.mode = mode
 
     def _determine_data_pad_width(self, data_shape):
+        if len(data_shape) < len(self._spatial_arr):
+            raise ValueError(f"spatial_size {self.spatial_size} has more dimensions than the image {data_shape}.")
+        diff = np.maximum(self._spatial_arr - np.asarray(data_shape[: len(self._spatial_arr)], dtype=np.int64), 0)
         if self.method == "symmetric":
-            pad_width = list()
-            for i in range(len(self.spatial_size)):
-                width = max(self.spatial_size[i] - data_shape[i], 0)
-                pad_width.append((width // 2, width - (width // 2)))
-            return pad_width
+            lo = diff >> 1
+            return np.stack([lo, diff - lo], axis=1)
         else:
-            return [(0, max(self.spatial_size[i] - data_shape[i], 0)) for i in range(len(self.spatial_size))]
+            return np.stack([np.zeros_like(diff), diff], axis=1)
 
     def __call__(self, img, mode: Optional[str] = None):
-        data_pad_width = self._determine_data_pad_width(img.shape[1:])
-        all_pad_width = [(0, 0)] + data_pad_width
-        if not np.asarray(all_pad_width).any():
+        all_pad_width = [(0, 0)] + self._determine_data_pad_width(img.shape[1:]).tolist()
+        if not _has_any_pad(all_pad_width):
             # all zeros, skip padding
             return img
         else:
-            img = np.pad(img, all_pad_width, mode=mode or self.mode)
-            return img
+            return _pad(img, all_pad_width, mode=mode or self.mode)
 
 
 class BorderPad(Transform):
     """
     Pad the input data by adding specified borders to every dimension.
+    The 'constant' and 'edge' modes copy the input once into a preallocated output
+    (channel first torch tensors are padded with `torch.nn.functional.pad` instead),
+    the other modes are delegated to np.pad.
 
     Args:
         spatial_border (int or sequence of int): specified size for every spatial border. it can be 3 shapes:
@@ -88,24 +159,34 @@ class BorderPad(Transform):
     def __init__(self, spatial_border, mode: str = "constant"):
         self.spatial_border = spatial_border
         self.mode = mode
+        # the full pad widths (including the channel dim) for the number of spatial dims
+        self._pad_width_cache: Dict[int, tuple] = {}
 
-    def __call__(self, img, mode: Optional[str] = None):
-        spatial_shape = img.shape[1:]
+    def _determine_pad_width(self, spatial_ndim: int):
         spatial_border = ensure_tuple(self.spatial_border)
         for b in spatial_border:
             if b < 0 or not isinstance(b, int):
                 raise ValueError("spatial_border must be int number and can not be less than 0.")
 
         if len(spatial_border) == 1:
-            data_pad_width = [(spatial_border[0], spatial_border[0]) for _ in range(len(spatial_shape))]
-        elif len(spatial_border) == len(spatial_shape):
-            data_pad_width = [(spatial_border[i], spatial_border[i]) for i in range(len(spatial_shape))]
-        elif len(spatial_border) == len(spatial_shape) * 2:
-            data_pad_width = [(spatial_border[2 * i], spatial_border[2 * i + 1]) for i in range(len(spatial_shape))]
+            data_pad_width = [(spatial_border[0], spatial_border[0]) for _ in range(spatial_ndim)]
+        elif len(spatial_border) == spatial_ndim:
+            data_pad_width = [(spatial_border[i], spatial_border[i]) for i in range(spatial_ndim)]
+        elif len(spatial_border) == spatial_ndim * 2:
+            data_pad_width = [(spatial_border[2 * i], spatial_border[2 * i + 1]) for i in range(spatial_ndim)]
         else:
             raise ValueError("unsupported length of spatial_border definition.")
+        return tuple([(0, 0)] + data_pad_width)
 
-        return np.pad(img, [(0, 0)] + data_pad_width, mode=mode or self.mode)
+    def __call__(self, img, mode: Optional[str] = None):
+        spatial_ndim = len(img.shape) - 1
+        all_pad_width = self._pad_width_cache.get(spatial_ndim)
+        if all_pad_width is None:
+            all_pad_width = self._pad_width_cache[spatial_ndim] = self._determine_pad_width(spatial_ndim)
+        if not _has_any_pad(all_pad_width):
+            # all zeros, skip padding
+            return img
+        return _pad(img, all_pad_width, mode=mode or self.mode)
 
 
 class DivisiblePad(Transform):
@@ -125,17 +206,18 @@ class DivisiblePad(Transform):
         """
         self.k = k
         self.mode = mode
+        self._padder_cache: OrderedDict = OrderedDict()
 
-    def __call__(self, img, mode: Optional[str] = None):
-        spatial_shape = img.shape[1:]
+    def _build_padder(self, spatial_shape):
         k = ensure_tuple_rep(self.k, len(spatial_shape))
-        new_size = []
-        for k_d, dim in zip(k, spatial_shape):
-            new_dim = int(np.ceil(dim / k_d) * k_d) if k_d > 0 else dim
-            new_size.append(new_dim)
+        new_size = [((dim + k_d - 1) // k_d) * k_d if k_d > 0 else dim for k_d, dim in zip(k, spatial_shape)]
+        return SpatialPad(spatial_size=new_size, method="symmetric")
 
-        spatial_pad = SpatialPad(spatial_size=new_size, method="symmetric", mode=mode or self.mode)
-        return spatial_pad(img)
+    def __call__(self, img, mode: Optional[str] = None):
+        spatial_shape = img.shape[1:]
+        # the padder only depends on the input spatial shape, reuse it for the inputs of the same shape
+        spatial_pad = _cache_get(self._padder_cache, spatial_shape, lambda: self._build_padder(spatial_shape))
+        return spatial_pad(img, mode=mode or self.mode)
 
 
 class SpatialCrop(Transform):
@@ -156,27 +238,27 @@ class SpatialCrop(Transform):
             roi_end (list or tuple): voxel coordinates for end of the crop ROI.
         """
         if roi_center is not None and roi_size is not None:
-            roi_center = np.asarray(roi_center, dtype=np.uint16)
-            roi_size = np.asarray(roi_size, dtype=np.uint16)
-            self.roi_start = np.subtract(roi_center, np.floor_divide(roi_size, 2))
-            self.roi_end = np.add(self.roi_start, roi_size)
+            roi_size = [int(i) for i in roi_size]
+            self.roi_start = tuple(int(c) - s // 2 for c, s in zip(roi_center, roi_size))
+            self.roi_end = tuple(start + s for start, s in zip(self.roi_start, roi_size))
         else:
             assert roi_start is not None and roi_end is not None, "roi_start and roi_end must be provided."
-            self.roi_start = np.asarray(roi_start, dtype=np.uint16)
-            self.roi_end = np.asarray(roi_end, dtype=np.uint16)
+            self.roi_start = tuple(int(i) for i in roi_start)
+            self.roi_end = tuple(int(i) for i in roi_end)
 
-        assert np.all(self.roi_start >= 0), "all elements of roi_start must be greater than or equal to 0."
-        assert np.all(self.roi_end > 0), "all elements of roi_end must be positive."
-        assert np.all(self.roi_end >= self.roi_start), "invalid roi range."
+        assert all(s >= 0 for s in self.roi_start), "all elements of roi_start must be greater than or equal to 0."
+        assert all(e > 0 for e in self.roi_end), "all elements of roi_end must be positive."
+        assert all(e >= s for s, e in zip(self.roi_start, self.roi_end)), "invalid roi range."
+        # the channel dim is not cropped, `__call__` takes the first `img.ndim` slices
+        self._slices = (slice(None),) + tuple(slice(s, e) for s, e in zip(self.roi_start, self.roi_end))
+        self._crop_size = tuple(e - s for s, e in zip(self.roi_start, self.roi_end))
 
     def __call__(self, img):
-        max_end = img.shape[1:]
-        sd = min(len(self.roi_start), len(max_end))
-        assert np.all(max_end[:sd] >= self.roi_start[:sd]), "roi start out of image space."
-        assert np.all(max_end[:sd] >= self.roi_end[:sd]), "roi end out of image space."
-
-        slices = [slice(None)] + [slice(s, e) for s, e in zip(self.roi_start[:sd], self.roi_end[:sd])]
-        return img[tuple(slices)]
+        result = img[self._slices[: img.ndim]]
+        # slicing stops at the image border, so the ROI is within the image if and only if nothing was cut off
+        spatial_dims = img.ndim - 1
+        assert result.shape[1 : 1 + len(self._crop_size)] == self._crop_size[:spatial_dims], "roi out of image space."
+        return result
 
 
 class CenterSpatialCrop(Transform):
@@ -189,10 +271,15 @@ class CenterSpatialCrop(Transform):
 
     def __init__(self, roi_size):
         self.roi_size = roi_size
+        self._cropper_cache: OrderedDict = OrderedDict()
+
+    def _build_cropper(self, spatial_shape):
+        center = [i // 2 for i in spatial_shape]
+        return SpatialCrop(roi_center=center, roi_size=self.roi_size)
 
     def __call__(self, img):
-        center = [i // 2 for i in img.shape[1:]]
-        cropper = SpatialCrop(roi_center=center, roi_size=self.roi_size)
+        spatial_shape = img.shape[1:]
+        cropper = _cache_get(self._cropper_cache, spatial_shape, lambda: self._build_cropper(spatial_shape))
         return cropper(img)
 
 
@@ -215,22 +302,43 @@ class RandSpatialCrop(Randomizable, Transform):
         self.random_size = random_size
         self._size = None
         self._slices = None
+        # (image size, roi size) and the corresponding valid patch size of the last fixed size crop
+        self._valid_size_cache = (None, None)
 
     def randomize(self, img_size):
         self._size = ensure_tuple_rep(self.roi_size, len(img_size))
         if self.random_size:
             self._size = [self.R.randint(low=self._size[i], high=img_size[i] + 1) for i in range(len(img_size))]
         if self.random_center:
-            valid_size = get_valid_patch_size(img_size, self._size)
-            self._slices = ensure_tuple(slice(None)) + get_random_patch(img_size, valid_size, self.R)
-
-    def __call__(self, img):
+            if self.random_size:
+                valid_size = get_valid_patch_size(img_size, self._size)
+            elif self._valid_size_cache[0] == (img_size, self._size):
+                valid_size = self._valid_size_cache[1]
+            else:
+                valid_size = get_valid_patch_size(img_size, self._size)
+                self._valid_size_cache = ((img_size, self._size), valid_size)
+            self._slices = (slice(None),) + get_random_patch(img_size, valid_size, self.R)
+
+    def __call__(self, img, out: Optional[np.ndarray] = None):
+        """
+        Args:
+            img: channel first image to crop.
+            out: if provided, the crop is copied into this preallocated array (for example an item of
+                a batch buffer) and `out` is returned. Its shape must match the crop, so it's
+                typically used with `random_size=False`.
+        """
         self.randomize(img.shape[1:])
         if self.random_center:
-            return img[self._slices]
+            result = img[self._slices]
         else:
             cropper = CenterSpatialCrop(self._size)
-            return cropper(img)
+            result = cropper(img)
+        if out is None:
+            return result
+        if out.shape != result.shape:
+            raise ValueError(f"the shape of out {out.shape} doesn't match the shape of the crop {result.shape}.")
+        np.copyto(out, result)
+        return out
 
 
 class RandSpatialCropSamples(Randomizable, Transform):
@@ -255,12 +363,30 @@ class RandSpatialCropSamples(Randomizable, Transform):
             raise ValueError("number of samples must be greater than 0.")
         self.num_samples = num_samples
         self.cropper = RandSpatialCrop(roi_size, random_center, random_size)
+        self._size = None
+        self._starts = None
 
-    def randomize(self):
-        pass
+    def randomize(self, img_size):
+        """
+        Generates the start coordinates of all the `num_samples` fixed size crops with a single call
+        to the random state of `self.cropper`, the random sequence is the same as that of
+        `num_samples` calls to `self.cropper`.
+        """
+        self._size = get_valid_patch_size(img_size, ensure_tuple_rep(self.cropper.roi_size, len(img_size)))
+        self._starts = np.zeros((self.num_samples, len(img_size)), dtype=np.int64)
+        rand_dims = [i for i, (ms, ps) in enumerate(zip(img_size, self._size)) if ms > ps]
+        if rand_dims:
+            high = [img_size[i] - self._size[i] for i in rand_dims]
+            self._starts[:, rand_dims] = self.cropper.R.randint(0, high, size=(self.num_samples, len(rand_dims)))
 
     def __call__(self, img):
-        return [self.cropper(img) for _ in range(self.num_samples)]
+        if self.cropper.random_size or not self.cropper.random_center:
+            return [self.cropper(img) for _ in range(self.num_samples)]
+        self.randomize(img.shape[1:])
+        return [
+            img[(slice(None),) + tuple(slice(s, s + ps) for s, ps in zip(start, self._size))]
+            for start in self._starts.tolist()
+        ]
 
 
 class CropForeground(Transform):
@@ -289,7 +415,7 @@ class CropForeground(Transform):
     """
 
     def __init__(
-        self, select_fn: Callable = lambda x: x > 0, channel_indexes: Optional[IndexSelection] = None, margin: int = 0
+        self, select_fn: Callable = _select_positive, channel_indexes: Optional[IndexSelection] = None, margin: int = 0
     ):
         """
         Args:
@@ -301,8 +427,14 @@ class CropForeground(Transform):
         self.select_fn = select_fn
         self.channel_indexes = ensure_tuple(channel_indexes) if channel_indexes is not None else None
         self.margin = margin
+        # the default `select_fn` on all the channels can be computed by a single pass numba kernel
+        self._threshold = 0 if select_fn is _select_positive and self.channel_indexes is None else None
 
     def __call__(self, img):
-        box_start, box_end = generate_spatial_bounding_box(img, self.select_fn, self.channel_indexes, self.margin)
-        cropper = SpatialCrop(roi_start=box_start, roi_end=box_end)
-        return cropper(img)
+        box = None
+        if self._threshold is not None and isinstance(self.margin, int):
+            box = fast_bounding_box(img, self._threshold, self.margin)
+        if box is None:
+            box = generate_spatial_bounding_box(img, self.select_fn, self.channel_indexes, self.margin)
+        box_start, box_end = box
+        return img[(slice(None),) + tuple(slice(int(s), int(e)) for s, e in zip(box_start, box_end))]
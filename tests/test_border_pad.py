@@ -32,6 +32,16 @@ TEST_CASE_3 = [
     np.zeros((3, 11, 15, 15)),
 ]
 
+TEST_CASE_4 = [
+    {"spatial_border": [1, 2, 3, 4, 5, 6], "mode": "constant"},
+    np.arange(3 * 4 * 2 * 3, dtype=np.float32).reshape((3, 4, 2, 3)),
+]
+
+TEST_CASE_5 = [
+    {"spatial_border": [1, 0, 3], "mode": "edge"},
+    np.arange(3 * 4 * 2 * 3, dtype=np.float32).reshape((3, 4, 2, 3)),
+]
+
 
 class TestBorderPad(unittest.TestCase):
     @parameterized.expand([TEST_CASE_1, TEST_CASE_2, TEST_CASE_3])
@@ -42,6 +52,26 @@ class TestBorderPad(unittest.TestCase):
         result = padder(input_data, mode=input_param["mode"])
         self.assertAlmostEqual(result.shape, expected_val.shape)
 
+    @parameterized.expand([TEST_CASE_4, TEST_CASE_5])
+    def test_pad_value(self, input_param, input_data):
+        result = BorderPad(**input_param)(input_data)
+        border = input_param["spatial_border"]
+        if len(border) == input_data.ndim - 1:
+            pad_width = [(0, 0)] + [(b, b) for b in border]
+        else:
+            pad_width = [(0, 0)] + [(border[2 * i], border[2 * i + 1]) for i in range(input_data.ndim - 1)]
+        expected = np.pad(input_data, pad_width, mode=input_param["mode"])
+        self.assertEqual(result.dtype, expected.dtype)
+        np.testing.assert_allclose(result, expected)
+
+    def test_no_pad(self):
+        input_data = np.zeros((3, 4, 2, 3))
+        self.assertIs(BorderPad(spatial_border=0)(input_data), input_data)
+
+    def test_edge_empty_axis(self):
+        with self.assertRaises(ValueError):
+            BorderPad(spatial_border=1, mode="edge")(np.zeros((1, 0, 3)))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -34,6 +34,13 @@ class TestCenterSpatialCrop(unittest.TestCase):
         result = CenterSpatialCrop(**input_param)(input_data)
         np.testing.assert_allclose(result, expected_value)
 
+    def test_varying_shapes(self):
+        cropper = CenterSpatialCrop(roi_size=[2, 3])
+        for shape in [(1, 4, 5), (2, 6, 7), (1, 4, 5)]:
+            input_data = np.random.randint(0, 10, size=shape)
+            h, w = shape[1] // 2, shape[2] // 2
+            np.testing.assert_allclose(cropper(input_data), input_data[:, h - 1 : h + 1, w - 1 : w + 2])
+
 
 if __name__ == "__main__":
     unittest.main()
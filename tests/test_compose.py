@@ -11,7 +11,9 @@
 
 import unittest
 
-from monai.transforms import Compose, Randomizable, AddChannel
+import numpy as np
+
+from monai.transforms import Compose, Randomizable, AddChannel, RandAffine
 
 
 class TestCompose(unittest.TestCase):
@@ -85,6 +87,24 @@ class TestCompose(unittest.TestCase):
         c.randomize()
         self.assertAlmostEqual(c(1), 2.57673391)
 
+    def test_reseed(self):
+        class _Acc(Randomizable):
+            def randomize(self):
+                self.rand = self.R.rand()
+
+            def __call__(self, data):
+                self.randomize()
+                return self.rand + data
+
+        # RandAffine overrides `set_random_state` to seed its nested grid
+        c = Compose([_Acc(), RandAffine(prob=1.0, rotate_range=1.0, spatial_size=(8, 8))])
+        img = np.arange(64, dtype=np.float32).reshape((1, 8, 8))
+        c.set_random_state(123)
+        expected = c(img)
+        c(img)
+        c.reseed(123)
+        np.testing.assert_allclose(c(img), expected)
+
     def test_randomize_warn(self):
         class _RandomClass(Randomizable):
             def randomize(self, foo):
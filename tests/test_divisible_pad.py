@@ -39,6 +39,19 @@ class TestDivisiblePad(unittest.TestCase):
         result = padder(input_data, mode=input_param["mode"])
         self.assertAlmostEqual(result.shape, expected_val.shape)
 
+    def test_pad_varying_shapes(self):
+        padder = DivisiblePad(k=4)
+        for shape in [(2, 5, 6), (2, 7, 8), (2, 5, 6)]:
+            input_data = np.random.rand(*shape)
+            for mode in ("constant", "edge"):
+                result = padder(input_data, mode=mode)
+                width = [(0, 0)] + [((-d % 4) // 2, (-d % 4) - (-d % 4) // 2) for d in shape[1:]]
+                np.testing.assert_allclose(result, np.pad(input_data, width, mode=mode))
+
+    def test_no_pad(self):
+        input_data = np.zeros((3, 4, 8))
+        self.assertIs(DivisiblePad(k=4)(input_data), input_data)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -39,6 +39,12 @@ class TestGeneratePosNegLabelCropCenters(unittest.TestCase):
         self.assertEqual(len(result), expected_count)
         self.assertEqual(len(result[0]), expected_shape)
 
+    def test_large_image(self):
+        label = np.zeros((1, 70000, 1))
+        label[0, 68000] = 1
+        result = generate_pos_neg_label_crop_centers(label, [10, 1], 2, 1.0, rand_state=np.random.RandomState(0))
+        np.testing.assert_allclose(result, [[68000, 0], [68000, 0]])
+
 
 if __name__ == "__main__":
     unittest.main()
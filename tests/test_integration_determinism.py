@@ -19,46 +19,114 @@ from monai.data import create_test_image_2d
 from monai.losses import DiceLoss
 from monai.networks.nets import UNet
 from monai.transforms import Compose, AddChannel, RandRotate90, RandSpatialCrop, ScaleIntensity, ToTensor
-from monai.utils import set_determinism
-
-
-def run_test(batch_size=64, train_steps=200, device=torch.device("cuda:0")):
-    class _TestBatch(Dataset):
-        def __init__(self, transforms):
-            self.transforms = transforms
-
-        def __getitem__(self, _unused_id):
-            im, seg = create_test_image_2d(128, 128, noise_max=1, num_objs=4, num_seg_classes=1)
-            seed = np.random.randint(2147483647)
-            self.transforms.set_random_state(seed=seed)
-            im = self.transforms(im)
-            self.transforms.set_random_state(seed=seed)
-            seg = self.transforms(seg)
-            return im, seg
-
-        def __len__(self):
-            return train_steps
-
+from monai.transforms._fused import rescale_patch_rot90
+from monai.utils import optional_import, set_determinism
+
+_, has_numba = optional_import("numba")
+
+
+def _worker_init_fn(worker_id):
+    # the transform seeds are drawn up front, this only makes `create_test_image_2d` deterministic in every worker
+    np.random.seed(torch.utils.data.get_worker_info().seed % (2 ** 32))
+
+
+class _TestBatch(Dataset):
+    def __init__(self, transforms, train_steps):
+        self.transforms = transforms
+        self.train_steps = train_steps
+        # draw the transform seeds up front, in the main process
+        self.seeds = np.random.randint(2147483647, size=train_steps)
+
+    def __getitem__(self, index):
+        im, seg = create_test_image_2d(128, 128, noise_max=1, num_objs=4, num_seg_classes=1)
+        seed = int(self.seeds[index])
+        # the transforms own their random states, reseeding them in place is safe
+        self.transforms.reseed(seed)
+        im = self.transforms(im)
+        self.transforms.reseed(seed)
+        seg = self.transforms(seg)
+        return im, seg
+
+    def __len__(self):
+        return self.train_steps
+
+
+class _FusedTransform:
+    """
+    Same output and random draws as ``Compose([AddChannel(), ScaleIntensity(), RandSpatialCrop(roi_size,
+    random_size=False), RandRotate90(), ToTensor()])`` for 2D inputs, in a single pass with `rescale_patch_rot90`.
+    """
+
+    def __init__(self, roi_size):
+        if not has_numba:
+            raise RuntimeError("the fused transform requires numba.")
+        self.cropper = RandSpatialCrop(roi_size, random_size=False)
+        self.rotator = RandRotate90()
+
+    def set_random_state(self, seed=None, state=None):
+        self.cropper.set_random_state(seed, state)
+        self.rotator.set_random_state(seed, state)
+
+    def reseed(self, seed):
+        self.cropper.reseed(seed)
+        self.rotator.reseed(seed)
+
+    def __call__(self, img):
+        # relies on the private `_slices`, `_rand_k` and `_do_transform` attributes set by `randomize`,
+        # this must track the RandSpatialCrop and RandRotate90 implementations
+        self.cropper.randomize(img.shape)
+        self.rotator.randomize()
+        k = self.rotator._rand_k if self.rotator._do_transform else 0
+        y_slice, x_slice = self.cropper._slices[1:]
+        patch_shape = (y_slice.stop - y_slice.start, x_slice.stop - x_slice.start)
+        out_shape = patch_shape[::-1] if k % 2 else patch_shape
+        out = np.empty((1,) + out_shape, dtype=img.dtype if img.dtype.kind == "f" else np.float64)
+        rescale_patch_rot90(img, out[0], y_slice.start, x_slice.start, k, img.min(), img.max())
+        return torch.as_tensor(out)
+
+
+def run_test(
+    batch_size=64,
+    train_steps=200,
+    device=torch.device("cuda:0"),
+    num_workers=4,
+    use_compile=False,
+    fused_transform=False,
+):
     net = UNet(
         dimensions=2, in_channels=1, out_channels=1, channels=(4, 8, 16, 32), strides=(2, 2, 2), num_res_units=2
     ).to(device)
+    if use_compile:
+        if not hasattr(torch, "compile"):
+            raise RuntimeError("use_compile requires torch.compile (PyTorch 2.0 or later).")
+        net = torch.compile(net, mode="reduce-overhead")
 
     loss = DiceLoss(sigmoid=True)
     opt = torch.optim.Adam(net.parameters(), 1e-2)
-    train_transforms = Compose(
-        [AddChannel(), ScaleIntensity(), RandSpatialCrop((96, 96), random_size=False), RandRotate90(), ToTensor()]
+    if fused_transform:
+        train_transforms = _FusedTransform((96, 96))
+    else:
+        train_transforms = Compose(
+            [AddChannel(), ScaleIntensity(), RandSpatialCrop((96, 96), random_size=False), RandRotate90(), ToTensor()]
+        )
+
+    src = DataLoader(
+        _TestBatch(train_transforms, train_steps),
+        batch_size=batch_size,
+        shuffle=True,
+        num_workers=num_workers,
+        pin_memory=torch.device(device).type == "cuda",
+        worker_init_fn=_worker_init_fn,
     )
 
-    src = DataLoader(_TestBatch(train_transforms), batch_size=batch_size, shuffle=True)
-
     net.train()
     epoch_loss = 0
     step = 0
     for img, seg in src:
         step += 1
         opt.zero_grad()
-        output = net(img.to(device))
-        step_loss = loss(output, seg.to(device))
+        output = net(img.to(device, non_blocking=True))
+        step_loss = loss(output, seg.to(device, non_blocking=True))
         step_loss.backward()
         opt.step()
         epoch_loss += step_loss.item()
@@ -79,7 +147,36 @@ class TestDeterminism(unittest.TestCase):
         loss, step = run_test(device=self.device)
         print(f"Deterministic loss {loss} at training step {step}")
         np.testing.assert_allclose(step, 4)
-        np.testing.assert_allclose(loss, 0.5346279, rtol=1e-6)
+        np.testing.assert_allclose(loss, 0.5378666, rtol=1e-6)
+
+    @unittest.skipUnless(has_numba, "Requires numba")
+    def test_training_fused_transform(self):
+        loss, step = run_test(device=self.device, fused_transform=True)
+        np.testing.assert_allclose(step, 4)
+        np.testing.assert_allclose(loss, 0.5378666, rtol=1e-6)
+
+    @unittest.skipUnless(has_numba, "Requires numba")
+    def test_fused_transform(self):
+        transforms = Compose(
+            [
+                AddChannel(),
+                ScaleIntensity(),
+                RandSpatialCrop((96, 96), random_size=False),
+                RandRotate90(prob=0.5),
+                ToTensor(),
+            ]
+        )
+        fused = _FusedTransform((96, 96))
+        fused.rotator.prob = 0.5  # to cover all the rotations
+        for seed in range(20):
+            im, seg = create_test_image_2d(128, 128, noise_max=1, num_objs=4, num_seg_classes=1)
+            for data in (im, seg):
+                transforms.set_random_state(seed=seed)
+                expected = transforms(data)
+                fused.set_random_state(seed=seed)
+                result = fused(data)
+                self.assertEqual(result.dtype, expected.dtype)
+                np.testing.assert_array_equal(result.numpy(), expected.numpy())
 
 
 if __name__ == "__main__":
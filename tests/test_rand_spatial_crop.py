@@ -41,6 +41,29 @@ class TestRandSpatialCrop(unittest.TestCase):
         roi = [(2 - i // 2, 2 + i - i // 2) for i in cropper._size]
         np.testing.assert_allclose(result, input_data[:, roi[0][0] : roi[0][1], roi[1][0] : roi[1][1]])
 
+    def test_fixed_size_varying_shapes(self):
+        cropper = RandSpatialCrop(roi_size=[4, 5], random_size=False)
+        for shape, expected_shape in [((1, 6, 8), (1, 4, 5)), ((1, 3, 9), (1, 3, 5)), ((1, 6, 8), (1, 4, 5))]:
+            result = cropper(np.random.randint(0, 2, size=shape))
+            self.assertTupleEqual(result.shape, expected_shape)
+
+    @parameterized.expand([[True], [False]])
+    def test_out(self, random_center):
+        input_data = np.random.randint(0, 10, size=[2, 7, 8])
+        cropper = RandSpatialCrop(roi_size=[4, 5], random_center=random_center, random_size=False)
+        expected = cropper.set_random_state(seed=0)(input_data)
+        out = np.zeros((3, 2, 4, 5), dtype=input_data.dtype)
+        buffer = out[1]
+        result = cropper.set_random_state(seed=0)(input_data, out=buffer)
+        self.assertIs(result, buffer)
+        np.testing.assert_allclose(out[1], expected)
+        np.testing.assert_allclose(out[0], 0)
+        with self.assertRaises(ValueError):
+            cropper(input_data, out=out[:, 0])
+        with self.assertRaises(ValueError):
+            # would broadcast
+            cropper(input_data[:1], out=buffer)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -12,7 +12,7 @@
 import unittest
 import numpy as np
 from parameterized import parameterized
-from monai.transforms import RandSpatialCropSamples
+from monai.transforms import RandSpatialCrop, RandSpatialCropSamples
 
 TEST_CASE_1 = [
     {"roi_size": [3, 3, 3], "num_samples": 4, "random_center": True},
@@ -34,6 +34,17 @@ class TestRandSpatialCropSamples(unittest.TestCase):
         for item in result:
             self.assertTupleEqual(item.shape, expected_shape)
 
+    @parameterized.expand([[(3, 4, 3)], [(3, 5, 2)]])
+    def test_fixed_size_values(self, roi_size):
+        input_data = np.random.randint(0, 10, size=[2, 5, 7, 3])
+        cropper = RandSpatialCropSamples(roi_size=roi_size, num_samples=5, random_size=False)
+        cropper.cropper.set_random_state(seed=123)
+        result = cropper(input_data)
+        expected_cropper = RandSpatialCrop(roi_size=roi_size, random_size=False).set_random_state(seed=123)
+        self.assertEqual(len(result), 5)
+        for item in result:
+            np.testing.assert_allclose(item, expected_cropper(input_data))
+
 
 if __name__ == "__main__":
     unittest.main()
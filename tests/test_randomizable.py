@@ -43,6 +43,29 @@ class TestRandomizable(unittest.TestCase):
         inst.set_random_state(state=inst_r)
         self.assertAlmostEqual(inst.R.rand(), 0.69646918)
 
+    def test_reseed(self):
+        inst = RandTest()
+        inst.set_random_state(seed=42)
+        state = inst.R
+        inst.R.standard_normal()
+        inst.reseed(123)
+        self.assertIs(inst.R, state)
+        self.assertAlmostEqual(inst.R.rand(), 0.69646918)
+        # without its own state, a new one is created
+        default = RandTest()
+        default.reseed(123)
+        self.assertIsNot(default.R, RandTest.R)
+        self.assertAlmostEqual(default.R.rand(), 0.69646918)
+
+    def test_reseed_shared_state(self):
+        inst = RandTest()
+        other = RandTest()
+        inst.set_random_state(seed=1)
+        other.set_random_state(state=inst.R)
+        inst.set_random_state(seed=2)
+        self.assertAlmostEqual(other.R.rand(), np.random.RandomState(1).rand())
+        self.assertAlmostEqual(inst.R.rand(), np.random.RandomState(2).rand())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -30,13 +30,26 @@ TEST_CASE_4 = [
     (3, 2, 2, 2),
 ]
 
+TEST_CASE_5 = [{"roi_center": [66000, 1], "roi_size": [10, 2]}, np.random.randint(0, 2, size=[1, 70000, 2]), (1, 10, 2)]
+
 
 class TestSpatialCrop(unittest.TestCase):
-    @parameterized.expand([TEST_CASE_1, TEST_CASE_2, TEST_CASE_3, TEST_CASE_4])
+    @parameterized.expand([TEST_CASE_1, TEST_CASE_2, TEST_CASE_3, TEST_CASE_4, TEST_CASE_5])
     def test_shape(self, input_param, input_data, expected_shape):
         result = SpatialCrop(**input_param)(input_data)
         self.assertTupleEqual(result.shape, expected_shape)
 
+    def test_value(self):
+        input_data = np.random.randint(0, 10, size=[2, 6, 7, 8])
+        result = SpatialCrop(roi_center=[3, 3, 4], roi_size=[3, 4, 5])(input_data)
+        np.testing.assert_allclose(result, input_data[:, 2:5, 1:5, 2:7])
+
+    def test_invalid_roi(self):
+        with self.assertRaises(AssertionError):
+            SpatialCrop(roi_center=[1, 1], roi_size=[4, 4])
+        with self.assertRaises(AssertionError):
+            SpatialCrop(roi_start=[0, 0], roi_end=[4, 4])(np.zeros((1, 3, 5)))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -11,6 +11,7 @@
 
 import unittest
 import numpy as np
+import torch
 from parameterized import parameterized
 from monai.transforms import SpatialPad
 
@@ -26,6 +27,21 @@ TEST_CASE_2 = [
     np.zeros((3, 15, 8, 8)),
 ]
 
+TEST_CASE_3 = [
+    {"spatial_size": [15, 4, 8], "method": "symmetric", "mode": "constant"},
+    np.arange(3 * 8 * 2 * 4).reshape((3, 8, 2, 4)),
+]
+
+TEST_CASE_4 = [
+    {"spatial_size": [15, 4, 8], "method": "end", "mode": "edge"},
+    np.arange(3 * 8 * 2 * 4).reshape((3, 8, 2, 4)),
+]
+
+TEST_CASE_5 = [
+    {"spatial_size": [15, 4, 8], "method": "symmetric", "mode": "reflect"},
+    np.arange(3 * 8 * 2 * 4).reshape((3, 8, 2, 4)),
+]
+
 
 class TestSpatialPad(unittest.TestCase):
     @parameterized.expand([TEST_CASE_1, TEST_CASE_2])
@@ -36,6 +52,33 @@ class TestSpatialPad(unittest.TestCase):
         result = padder(input_data, mode=input_param["mode"])
         self.assertAlmostEqual(result.shape, expected_val.shape)
 
+    @parameterized.expand([TEST_CASE_3, TEST_CASE_4, TEST_CASE_5])
+    def test_pad_value(self, input_param, input_data):
+        result = SpatialPad(**input_param)(input_data)
+        width = [max(s - d, 0) for s, d in zip(input_param["spatial_size"], input_data.shape[1:])]
+        if input_param["method"] == "symmetric":
+            pad_width = [(0, 0)] + [(w // 2, w - w // 2) for w in width]
+        else:
+            pad_width = [(0, 0)] + [(0, w) for w in width]
+        expected = np.pad(input_data, pad_width, mode=input_param["mode"])
+        self.assertEqual(result.dtype, expected.dtype)
+        np.testing.assert_allclose(result, expected)
+
+    @parameterized.expand([TEST_CASE_3, TEST_CASE_4])
+    def test_pad_tensor(self, input_param, input_data):
+        padder = SpatialPad(**input_param)
+        result = padder(torch.as_tensor(input_data, dtype=torch.float32))
+        self.assertIsInstance(result, torch.Tensor)
+        np.testing.assert_allclose(result.numpy(), padder(input_data))
+
+    def test_too_few_dims(self):
+        with self.assertRaises(ValueError):
+            SpatialPad(spatial_size=[5, 6])(np.ones((1, 3)))
+
+    def test_pad_tensor_too_few_dims(self):
+        with self.assertRaises(ValueError):
+            SpatialPad(spatial_size=[6])(torch.arange(16.0).reshape(1, 4, 4))
+
 
 if __name__ == "__main__":
     unittest.main()